@@ -91,6 +91,10 @@ pip install -r ./lambdas/solution_helper/requirements.txt -t ./lambdas/solution_
 echo "pip install -r ./lib/blueprints/byom/lambdas/invoke_lambda_custom_resource/requirements.txt -t ./lib/blueprints/byom/lambdas/invoke_lambda_custom_resource/"
 pip install -r ./lib/blueprints/byom/lambdas/invoke_lambda_custom_resource/requirements.txt -t ./lib/blueprints/byom/lambdas/invoke_lambda_custom_resource/
 
+# setup orjson for the inference lambda (binary wheel, so pinned to the Lambda platform and python version)
+echo "pip install -r ./lib/blueprints/byom/lambdas/inference/requirements.txt -t ./lib/blueprints/byom/lambdas/inference/ --platform manylinux2014_x86_64 --python-version 3.8 --implementation cp --only-binary=:all:"
+pip install -r ./lib/blueprints/byom/lambdas/inference/requirements.txt -t ./lib/blueprints/byom/lambdas/inference/ --platform manylinux2014_x86_64 --python-version 3.8 --implementation cp --only-binary=:all:
+
 echo "------------------------------------------------------------------------------"
 echo "[Init] Install dependencies for the cdk-solution-helper"
 echo "------------------------------------------------------------------------------"
@@ -110,21 +114,31 @@ cd $source_dir
 echo "npm install -g aws-cdk@$cdk_version"
 npm install -g aws-cdk@$cdk_version
 
+# Synthesize the CDK app once into a cloud assembly, then print each BYOM blueprint template from it.
+# Passing the assembly directory as --app reads the already synthesized templates instead of re-running
+# the whole Python app (every stack in app.py) once per blueprint.
+blueprints_assembly_dir="$source_dir/cdk.out.blueprints"
+echo "cdk synth --path-metadata false --version-reporting false --output=$blueprints_assembly_dir"
+cdk synth --path-metadata false --version-reporting false --output=$blueprints_assembly_dir
+
 #Run 'cdk synth for BYOM blueprints
-echo "cdk synth DataQualityModelMonitorStack > lib/blueprints/byom/byom_data_quality_monitor.yaml --path-metadata false --version-reporting false"
-cdk synth DataQualityModelMonitorStack > lib/blueprints/byom/byom_data_quality_monitor.yaml --path-metadata false --version-reporting false
-echo "cdk synth ModelQualityModelMonitorStack > lib/blueprints/byom/byom_model_quality_monitor.yaml --path-metadata false --version-reporting false"
-cdk synth ModelQualityModelMonitorStack > lib/blueprints/byom/byom_model_quality_monitor.yaml --path-metadata false --version-reporting false
-echo "cdk synth SingleAccountCodePipelineStack > lib/blueprints/byom/single_account_codepipeline.yaml --path-metadata false --version-reporting false"
-cdk synth SingleAccountCodePipelineStack > lib/blueprints/byom/single_account_codepipeline.yaml --path-metadata false --version-reporting false
-echo "cdk synth MultiAccountCodePipelineStack > lib/blueprints/byom/multi_account_codepipeline.yaml --path-metadata false --version-reporting false"
-cdk synth MultiAccountCodePipelineStack > lib/blueprints/byom/multi_account_codepipeline.yaml --path-metadata false --version-reporting false
-echo "cdk synth BYOMRealtimePipelineStack > lib/blueprints/byom/byom_realtime_inference_pipeline.yaml --path-metadata false --version-reporting false"
-cdk synth BYOMRealtimePipelineStack > lib/blueprints/byom/byom_realtime_inference_pipeline.yaml --path-metadata false --version-reporting false
-echo "cdk synth BYOMCustomAlgorithmImageBuilderStack > lib/blueprints/byom/byom_custom_algorithm_image_builder.yaml --path-metadata false --version-reporting false"
-cdk synth BYOMCustomAlgorithmImageBuilderStack > lib/blueprints/byom/byom_custom_algorithm_image_builder.yaml --path-metadata false --version-reporting false
-echo "cdk synth BYOMBatchStack > lib/blueprints/byom/byom_batch_pipeline.yaml --path-metadata false --version-reporting false"
-cdk synth BYOMBatchStack > lib/blueprints/byom/byom_batch_pipeline.yaml --path-metadata false --version-reporting false
+echo "cdk synth --app $blueprints_assembly_dir DataQualityModelMonitorStack > lib/blueprints/byom/byom_data_quality_monitor.yaml"
+cdk synth --app $blueprints_assembly_dir DataQualityModelMonitorStack > lib/blueprints/byom/byom_data_quality_monitor.yaml
+echo "cdk synth --app $blueprints_assembly_dir ModelQualityModelMonitorStack > lib/blueprints/byom/byom_model_quality_monitor.yaml"
+cdk synth --app $blueprints_assembly_dir ModelQualityModelMonitorStack > lib/blueprints/byom/byom_model_quality_monitor.yaml
+echo "cdk synth --app $blueprints_assembly_dir SingleAccountCodePipelineStack > lib/blueprints/byom/single_account_codepipeline.yaml"
+cdk synth --app $blueprints_assembly_dir SingleAccountCodePipelineStack > lib/blueprints/byom/single_account_codepipeline.yaml
+echo "cdk synth --app $blueprints_assembly_dir MultiAccountCodePipelineStack > lib/blueprints/byom/multi_account_codepipeline.yaml"
+cdk synth --app $blueprints_assembly_dir MultiAccountCodePipelineStack > lib/blueprints/byom/multi_account_codepipeline.yaml
+echo "cdk synth --app $blueprints_assembly_dir BYOMRealtimePipelineStack > lib/blueprints/byom/byom_realtime_inference_pipeline.yaml"
+cdk synth --app $blueprints_assembly_dir BYOMRealtimePipelineStack > lib/blueprints/byom/byom_realtime_inference_pipeline.yaml
+echo "cdk synth --app $blueprints_assembly_dir BYOMCustomAlgorithmImageBuilderStack > lib/blueprints/byom/byom_custom_algorithm_image_builder.yaml"
+cdk synth --app $blueprints_assembly_dir BYOMCustomAlgorithmImageBuilderStack > lib/blueprints/byom/byom_custom_algorithm_image_builder.yaml
+echo "cdk synth --app $blueprints_assembly_dir BYOMBatchStack > lib/blueprints/byom/byom_batch_pipeline.yaml"
+cdk synth --app $blueprints_assembly_dir BYOMBatchStack > lib/blueprints/byom/byom_batch_pipeline.yaml
+
+echo "rm -rf $blueprints_assembly_dir"
+rm -rf $blueprints_assembly_dir
 
 # Replace %%VERSION%% in other templates
 replace="s/%%VERSION%%/$3/g"
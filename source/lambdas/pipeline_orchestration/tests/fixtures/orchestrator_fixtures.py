@@ -11,128 +11,245 @@
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
 import os
+import copy
 import pytest
 import uuid
 import json
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+
+
+_ENV = {
+    "BLUEPRINT_BUCKET_URL": "testurl",
+    "NOTIFICATION_EMAIL": "test@example.com",
+    "ASSETS_BUCKET": "testassetsbucket",
+    "BLUEPRINT_BUCKET": "testbucket",
+    "PIPELINE_STACK_NAME": "mlops-pipeline",
+    "CFN_ROLE_ARN": "arn:aws:role:region:account:action",
+    "IS_MULTI_ACCOUNT": "False",
+    "REGION": "us-east-1",
+    "ECR_REPO_ARN": "test-ecr-repo",
+    "DEV_ACCOUNT_ID": "dev_account_id",
+    "STAGING_ACCOUNT_ID": "staging_account_id",
+    "PROD_ACCOUNT_ID": "prod_account_id",
+    "DEV_ORG_ID": "dev_org_id",
+    "STAGING_ORG_ID": "staging_org_id",
+    "PROD_ORG_ID": "prod_org_id",
+    "MODELARTIFACTLOCATION": "model.tar.gz",
+    "INSTANCETYPE": "ml.m5.large",
+    "INFERENCEDATA": "inference/data.csv",
+    "BATCHOUTPUT": "bucket/output",
+    "DATACAPTURE": "bucket/datacapture",
+    "TRAININGDATA": "model_monitor/training-dataset-with-header.csv",
+    "BASELINEOUTPUT": "testbucket/model_monitor/baseline_output2",
+    "SCHEDULEEXP": "cron(0 * ? * * *)",
+    "CUSTOMIMAGE": "custom/custom_image.zip",
+    "TESTFILE": "testfile.zip",
+    "USE_MODEL_REGISTRY": "No",
+    "IS_DELEGATED_ADMIN": "No",
+    "MODEL_PACKAGE_GROUP_NAME": "xgboost",
+    "MODEL_PACKAGE_NAME": "arn:aws:sagemaker:*:*:model-package/xgboost/1",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_env_variables():
+    # only set (putenv) the variables that do not already hold the mocked value, so re-runs are a no-op
+    os.environ.update({key: value for key, value in _ENV.items() if os.environ.get(key) != value})
+
+
+_API_DATA_QUALITY_EVENT = {
+    "pipeline_type": "byom_data_quality_monitor",
+    "model_name": "testmodel",
+    "endpoint_name": "test_endpoint",
+    "baseline_data": _ENV["TRAININGDATA"],
+    "baseline_job_output_location": _ENV["BASELINEOUTPUT"],
+    "monitoring_output_location": "testbucket/model_monitor/monitor_output",
+    "data_capture_location": "testbucket/xgboost/datacapture",
+    "schedule_expression": _ENV["SCHEDULEEXP"],
+    "instance_type": _ENV["INSTANCETYPE"],
+    "instance_volume_size": "20",
+    "baseline_max_runtime_seconds": "3600",
+    "monitor_max_runtime_seconds": "1800",
+}
+
+
+_EXPECTED_DATA_QUALITY_MONITOR_PARAMS = [
+    ("BaselineJobName", "test_endpoint-baseline-job-ec3a"),
+    ("BaselineOutputBucket", "testbucket"),
+    ("BaselineJobOutputLocation", _ENV["BASELINEOUTPUT"]),
+    ("DataCaptureBucket", "testbucket"),
+    ("DataCaptureLocation", _ENV["BASELINEOUTPUT"]),
+    ("EndpointName", "test_endpoint"),
+    ("ImageUri", "156813124566.dkr.ecr.us-east-1.amazonaws.com/sagemaker-model-monitor-analyzer"),
+    ("InstanceType", _ENV["INSTANCETYPE"]),
+    ("InstanceVolumeSize", "20"),
+    ("BaselineMaxRuntimeSeconds", "3600"),
+    ("MonitorMaxRuntimeSeconds", "1800"),
+    ("MonitoringOutputLocation", "testbucket/model_monitor/monitor_output"),
+    ("MonitoringScheduleName", "test_endpoint-monitor-2a87"),
+    ("ScheduleExpression", _ENV["SCHEDULEEXP"]),
+    ("BaselineData", _ENV["TRAININGDATA"]),
+]
+
+
+_EXPECTED_IMAGE_BUILDER_PARAMS = [
+    ("NotificationEmail", _ENV["NOTIFICATION_EMAIL"]),
+    ("AssetsBucket", "testassetsbucket"),
+    ("CustomImage", _ENV["CUSTOMIMAGE"]),
+    ("ECRRepoName", "mlops-ecrrep"),
+    ("ImageTag", "tree"),
+]
+
+
+_EXPECT_SINGLE_ACCOUNT_PARAMS_FORMAT = {
+    "Parameters": {
+        "NotificationEmail": _ENV["NOTIFICATION_EMAIL"],
+        "AssetsBucket": "testassetsbucket",
+        "CustomImage": _ENV["CUSTOMIMAGE"],
+        "ECRRepoName": "mlops-ecrrep",
+        "ImageTag": "tree",
+    }
+}
+
+
+# read-only views: they compare equal to the dicts returned by format_template_parameters,
+# but any attempt to mutate the shared entries raises TypeError
+_EXPECTED_MULTI_ACCOUNT_PARAMS_FORMAT = [
+    MappingProxyType({"ParameterKey": "NotificationEmail", "ParameterValue": _ENV["NOTIFICATION_EMAIL"]}),
+    MappingProxyType({"ParameterKey": "AssetsBucket", "ParameterValue": "testassetsbucket"}),
+    MappingProxyType({"ParameterKey": "CustomImage", "ParameterValue": _ENV["CUSTOMIMAGE"]}),
+    MappingProxyType({"ParameterKey": "ECRRepoName", "ParameterValue": "mlops-ecrrep"}),
+    MappingProxyType({"ParameterKey": "ImageTag", "ParameterValue": "tree"}),
+]
+
+
+_TEMPLATE_BUCKET_PARAMS = [
+    ("AssetsBucket", "testassetsbucket"),
+    ("KmsKeyArn", ""),
+    ("BlueprintBucket", "testbucket"),
+]
+
+
+_EXPECTED_COMMON_REALTIME_BATCH_PARAMS = [
+    ("ModelName", "testmodel"),
+    ("ModelArtifactLocation", _ENV["MODELARTIFACTLOCATION"]),
+    ("InferenceInstance", _ENV["INSTANCETYPE"]),
+    ("CustomAlgorithmsECRRepoArn", "test-ecr-repo"),
+    ("ImageUri", "custom-image-uri"),
+    ("ModelPackageGroupName", ""),
+    ("ModelPackageName", _ENV["MODEL_PACKAGE_NAME"]),
+]
+
+
+_EXPECTED_BATCH_SPECIFIC_PARAMS = [
+    ("BatchInputBucket", "inference"),
+    ("BatchInferenceData", _ENV["INFERENCEDATA"]),
+    ("BatchOutputLocation", _ENV["BATCHOUTPUT"]),
+]
+
+
+_EXPECTED_BATCH_PARAMS = (
+    _TEMPLATE_BUCKET_PARAMS + _EXPECTED_COMMON_REALTIME_BATCH_PARAMS + _EXPECTED_BATCH_SPECIFIC_PARAMS
+)
+
+
+_BATCH_TYPES = frozenset(("byom_batch_builtin", "byom_batch_custom"))
+_REALTIME_TYPES = frozenset(("byom_realtime_builtin", "byom_realtime_custom"))
+_BUILTIN_TYPES = frozenset(("byom_realtime_builtin", "byom_batch_builtin"))
+_CUSTOM_TYPES = frozenset(("byom_realtime_custom", "byom_batch_custom"))
+
+
+#  map {<attribute_name>: {is_multi (True/False): <parameter-value>}}
+_BYOM_MAP = {
+    "inference_instance": {
+        True: {
+            "dev": _ENV["INSTANCETYPE"],
+            "staging": _ENV["INSTANCETYPE"],
+            "prod": _ENV["INSTANCETYPE"],
+        },
+        False: _ENV["INSTANCETYPE"],
+    },
+    "batch_job_output_location": {
+        True: {"dev": "bucket/dev_output", "staging": "bucket/staging_output", "prod": "bucket/prod_output"},
+        False: _ENV["BATCHOUTPUT"],
+    },
+    "data_capture_location": {
+        True: {
+            "dev": "bucket/dev_datacapture",
+            "staging": "bucket/staging_datacapture",
+            "prod": "bucket/prod_datacapture",
+        },
+        False: _ENV["DATACAPTURE"],
+    },
+    "endpoint_name": {
+        True: {
+            "dev": "dev-endpoint",
+            "staging": "staging-endpoint",
+            "prod": "prod-endpoint",
+        },
+        False: "test-endpoint",
+    },
+}
+
+
+def _build_byom_event(pipeline_type, is_multi, endpint_name_provided):
+    event = {
+        "pipeline_type": pipeline_type,
+        "model_name": "testmodel",
+        "model_artifact_location": _ENV["MODELARTIFACTLOCATION"],
+        "model_package_name": _ENV["MODEL_PACKAGE_NAME"],
+    }
+    event["inference_instance"] = _BYOM_MAP["inference_instance"][is_multi]
 
+    if pipeline_type in _BATCH_TYPES:
+        event["batch_inference_data"] = _ENV["INFERENCEDATA"]
+        event["batch_job_output_location"] = _BYOM_MAP["batch_job_output_location"][is_multi]
 
-@pytest.fixture(autouse=True)
-def mock_env_variables():
-    os.environ["BLUEPRINT_BUCKET_URL"] = "testurl"
-    os.environ["NOTIFICATION_EMAIL"] = "test@example.com"
-    os.environ["ASSETS_BUCKET"] = "testassetsbucket"
-    os.environ["BLUEPRINT_BUCKET"] = "testbucket"
-    os.environ["PIPELINE_STACK_NAME"] = "mlops-pipeline"
-    os.environ["CFN_ROLE_ARN"] = "arn:aws:role:region:account:action"
-    os.environ["IS_MULTI_ACCOUNT"] = "False"
-    os.environ["REGION"] = "us-east-1"
-    os.environ["ECR_REPO_ARN"] = "test-ecr-repo"
-    os.environ["DEV_ACCOUNT_ID"] = "dev_account_id"
-    os.environ["STAGING_ACCOUNT_ID"] = "staging_account_id"
-    os.environ["PROD_ACCOUNT_ID"] = "prod_account_id"
-    os.environ["DEV_ORG_ID"] = "dev_org_id"
-    os.environ["STAGING_ORG_ID"] = "staging_org_id"
-    os.environ["PROD_ORG_ID"] = "prod_org_id"
-    os.environ["MODELARTIFACTLOCATION"] = "model.tar.gz"
-    os.environ["INSTANCETYPE"] = "ml.m5.large"
-    os.environ["INFERENCEDATA"] = "inference/data.csv"
-    os.environ["BATCHOUTPUT"] = "bucket/output"
-    os.environ["DATACAPTURE"] = "bucket/datacapture"
-    os.environ["TRAININGDATA"] = "model_monitor/training-dataset-with-header.csv"
-    os.environ["BASELINEOUTPUT"] = "testbucket/model_monitor/baseline_output2"
-    os.environ["SCHEDULEEXP"] = "cron(0 * ? * * *)"
-    os.environ["CUSTOMIMAGE"] = "custom/custom_image.zip"
-    os.environ["TESTFILE"] = "testfile.zip"
-    os.environ["USE_MODEL_REGISTRY"] = "No"
-    os.environ["IS_DELEGATED_ADMIN"] = "No"
-    os.environ["MODEL_PACKAGE_GROUP_NAME"] = "xgboost"
-    os.environ["MODEL_PACKAGE_NAME"] = "arn:aws:sagemaker:*:*:model-package/xgboost/1"
+    if pipeline_type in _REALTIME_TYPES:
+        event["data_capture_location"] = _BYOM_MAP["data_capture_location"][is_multi]
+        # add optional endpoint_name
+        if endpint_name_provided:
+            event["endpoint_name"] = _BYOM_MAP["endpoint_name"][is_multi]
 
+    if pipeline_type in _BUILTIN_TYPES:
+        event["model_framework"] = "xgboost"
+        event["model_framework_version"] = "0.90-1"
+    elif pipeline_type in _CUSTOM_TYPES:
+        event["custom_image_uri"] = "custom-image-uri"
 
-@pytest.fixture
-def api_byom_event():
-    def _api_byom_event(pipeline_type, is_multi=False, endpint_name_provided=False):
-        #  create a map {<attribute_name>: {is_multi (True/False): <parameter-value>}}
-        maping = dict(
-            inference_instance={
-                "True": {
-                    "dev": os.environ["INSTANCETYPE"],
-                    "staging": os.environ["INSTANCETYPE"],
-                    "prod": os.environ["INSTANCETYPE"],
-                },
-                "False": os.environ["INSTANCETYPE"],
-            },
-            batch_job_output_location={
-                "True": {"dev": "bucket/dev_output", "staging": "bucket/staging_output", "prod": "bucket/prod_output"},
-                "False": os.environ["BATCHOUTPUT"],
-            },
-            data_capture_location={
-                "True": {
-                    "dev": "bucket/dev_datacapture",
-                    "staging": "bucket/staging_datacapture",
-                    "prod": "bucket/prod_datacapture",
-                },
-                "False": os.environ["DATACAPTURE"],
-            },
-            endpoint_name={
-                "True": {
-                    "dev": "dev-endpoint",
-                    "staging": "staging-endpoint",
-                    "prod": "prod-endpoint",
-                },
-                "False": "test-endpoint",
-            },
-        )
-        event = {
-            "pipeline_type": pipeline_type,
-            "model_name": "testmodel",
-            "model_artifact_location": os.environ["MODELARTIFACTLOCATION"],
-            "model_package_name": os.environ["MODEL_PACKAGE_NAME"],
-        }
-        event["inference_instance"] = maping["inference_instance"][str(is_multi)]
+    return event
 
-        if pipeline_type in ["byom_batch_builtin", "byom_batch_custom"]:
-            event["batch_inference_data"] = os.environ["INFERENCEDATA"]
-            event["batch_job_output_location"] = maping["batch_job_output_location"][str(is_multi)]
 
-        if pipeline_type in ["byom_realtime_builtin", "byom_realtime_custom"]:
-            event["data_capture_location"] = maping["data_capture_location"][str(is_multi)]
-            # add optional endpoint_name
-            if endpint_name_provided:
-                event["endpoint_name"] = maping["endpoint_name"][str(is_multi)]
+_BYOM_EVENT_CACHE = {
+    (pipeline_type, is_multi, endpint_name_provided): _build_byom_event(pipeline_type, is_multi, endpint_name_provided)
+    for pipeline_type in (*_BATCH_TYPES, *_REALTIME_TYPES)
+    for is_multi in (False, True)
+    for endpint_name_provided in (False, True)
+}
 
-        if pipeline_type in ["byom_realtime_builtin", "byom_batch_builtin"]:
-            event["model_framework"] = "xgboost"
-            event["model_framework_version"] = "0.90-1"
-        elif pipeline_type in ["byom_realtime_custom", "byom_batch_custom"]:
-            event["custom_image_uri"] = "custom-image-uri"
 
-        return event
+@pytest.fixture
+def api_byom_event():
+    def _api_byom_event(pipeline_type, is_multi=False, endpint_name_provided=False):
+        key = (pipeline_type, is_multi, endpint_name_provided)
+        if key not in _BYOM_EVENT_CACHE:
+            _BYOM_EVENT_CACHE[key] = _build_byom_event(*key)
+        # tests update/delete keys on the returned event, so hand out a deep copy of the cached one
+        return copy.deepcopy(_BYOM_EVENT_CACHE[key])
 
     return _api_byom_event
 
 
 @pytest.fixture
 def api_data_quality_event():
-    return {
-        "pipeline_type": "byom_data_quality_monitor",
-        "model_name": "testmodel",
-        "endpoint_name": "test_endpoint",
-        "baseline_data": os.environ["TRAININGDATA"],
-        "baseline_job_output_location": os.environ["BASELINEOUTPUT"],
-        "monitoring_output_location": "testbucket/model_monitor/monitor_output",
-        "data_capture_location": "testbucket/xgboost/datacapture",
-        "schedule_expression": os.environ["SCHEDULEEXP"],
-        "instance_type": os.environ["INSTANCETYPE"],
-        "instance_volume_size": "20",
-        "baseline_max_runtime_seconds": "3600",
-        "monitor_max_runtime_seconds": "1800",
-    }
+    return copy.deepcopy(_API_DATA_QUALITY_EVENT)
 
 
 @pytest.fixture
 def api_model_quality_event(api_data_quality_event):
-    model_quality_event = api_data_quality_event.copy()
+    model_quality_event = copy.deepcopy(api_data_quality_event)
     model_quality_event.update(
         {
             "pipeline_type": "byom_model_quality_monitor",
@@ -150,7 +267,7 @@ def api_model_quality_event(api_data_quality_event):
 def api_image_builder_event():
     return {
         "pipeline_type": "byom_image_builder",
-        "custom_algorithm_docker": os.environ["CUSTOMIMAGE"],
+        "custom_algorithm_docker": _ENV["CUSTOMIMAGE"],
         "ecr_repo_name": "mlops-ecrrep",
         "image_tag": "tree",
     }
@@ -160,50 +277,24 @@ def api_image_builder_event():
 def expected_params_realtime_custom():
     def _expected_params_realtime_custom(endpoint_name_provided=False):
         endpoint_name = "test-endpoint" if endpoint_name_provided else ""
-        expected_params = [
-            ("AssetsBucket", "testassetsbucket"),
-            ("KmsKeyArn", ""),
-            ("BlueprintBucket", "testbucket"),
-            ("ModelName", "testmodel"),
-            ("ModelArtifactLocation", os.environ["MODELARTIFACTLOCATION"]),
-            ("InferenceInstance", os.environ["INSTANCETYPE"]),
-            ("CustomAlgorithmsECRRepoArn", "test-ecr-repo"),
-            ("ImageUri", "custom-image-uri"),
-            ("ModelPackageGroupName", ""),
-            ("ModelPackageName", os.environ["MODEL_PACKAGE_NAME"]),
-            ("DataCaptureLocation", os.environ["DATACAPTURE"]),
+        return [
+            *_TEMPLATE_BUCKET_PARAMS,
+            *_EXPECTED_COMMON_REALTIME_BATCH_PARAMS,
+            ("DataCaptureLocation", _ENV["DATACAPTURE"]),
             ("EndpointName", endpoint_name),
         ]
 
-        return expected_params
-
     return _expected_params_realtime_custom
 
 
 @pytest.fixture
 def expected_data_quality_monitor_params():
-    return [
-        ("BaselineJobName", "test_endpoint-baseline-job-ec3a"),
-        ("BaselineOutputBucket", "testbucket"),
-        ("BaselineJobOutputLocation", os.environ["BASELINEOUTPUT"]),
-        ("DataCaptureBucket", "testbucket"),
-        ("DataCaptureLocation", os.environ["BASELINEOUTPUT"]),
-        ("EndpointName", "test_endpoint"),
-        ("ImageUri", "156813124566.dkr.ecr.us-east-1.amazonaws.com/sagemaker-model-monitor-analyzer"),
-        ("InstanceType", os.environ["INSTANCETYPE"]),
-        ("InstanceVolumeSize", "20"),
-        ("BaselineMaxRuntimeSeconds", "3600"),
-        ("MonitorMaxRuntimeSeconds", "1800"),
-        ("MonitoringOutputLocation", "testbucket/model_monitor/monitor_output"),
-        ("MonitoringScheduleName", "test_endpoint-monitor-2a87"),
-        ("ScheduleExpression", os.environ["SCHEDULEEXP"]),
-        ("BaselineData", os.environ["TRAININGDATA"]),
-    ]
+    return copy.deepcopy(_EXPECTED_DATA_QUALITY_MONITOR_PARAMS)
 
 
 @pytest.fixture
 def expected_model_quality_monitor_params(expected_data_quality_monitor_params):
-    expected_model_quality = expected_data_quality_monitor_params.copy()
+    expected_model_quality = copy.deepcopy(expected_data_quality_monitor_params)
 
     expected_model_quality.extend(
         [
@@ -223,48 +314,26 @@ def expected_model_quality_monitor_params(expected_data_quality_monitor_params):
 
 @pytest.fixture
 def expected_common_realtime_batch_params():
-    return [
-        ("ModelName", "testmodel"),
-        ("ModelArtifactLocation", os.environ["MODELARTIFACTLOCATION"]),
-        ("InferenceInstance", os.environ["INSTANCETYPE"]),
-        ("CustomAlgorithmsECRRepoArn", "test-ecr-repo"),
-        ("ImageUri", "custom-image-uri"),
-        ("ModelPackageGroupName", ""),
-        ("ModelPackageName", os.environ["MODEL_PACKAGE_NAME"]),
-    ]
+    return _EXPECTED_COMMON_REALTIME_BATCH_PARAMS
 
 
 @pytest.fixture
 def expected_image_builder_params():
-    return [
-        ("NotificationEmail", os.environ["NOTIFICATION_EMAIL"]),
-        ("AssetsBucket", "testassetsbucket"),
-        ("CustomImage", os.environ["CUSTOMIMAGE"]),
-        ("ECRRepoName", "mlops-ecrrep"),
-        ("ImageTag", "tree"),
-    ]
+    return _EXPECTED_IMAGE_BUILDER_PARAMS
 
 
 @pytest.fixture
 def expected_realtime_specific_params():
     def _expected_realtime_specific_params(endpoint_name_provided=False):
         endpoint_name = "test-endpoint" if endpoint_name_provided else ""
-        return [("DataCaptureLocation", os.environ["DATACAPTURE"]), ("EndpointName", endpoint_name)]
+        return [("DataCaptureLocation", _ENV["DATACAPTURE"]), ("EndpointName", endpoint_name)]
 
     return _expected_realtime_specific_params
 
 
 @pytest.fixture
 def expect_single_account_params_format():
-    return {
-        "Parameters": {
-            "NotificationEmail": os.environ["NOTIFICATION_EMAIL"],
-            "AssetsBucket": "testassetsbucket",
-            "CustomImage": os.environ["CUSTOMIMAGE"],
-            "ECRRepoName": "mlops-ecrrep",
-            "ImageTag": "tree",
-        }
-    }
+    return _EXPECT_SINGLE_ACCOUNT_PARAMS_FORMAT
 
 
 @pytest.fixture
@@ -274,41 +343,66 @@ def stack_name():
 
 @pytest.fixture
 def expected_multi_account_params_format():
-    return [
-        {"ParameterKey": "NotificationEmail", "ParameterValue": os.environ["NOTIFICATION_EMAIL"]},
-        {"ParameterKey": "AssetsBucket", "ParameterValue": "testassetsbucket"},
-        {"ParameterKey": "CustomImage", "ParameterValue": os.environ["CUSTOMIMAGE"]},
-        {"ParameterKey": "ECRRepoName", "ParameterValue": "mlops-ecrrep"},
-        {"ParameterKey": "ImageTag", "ParameterValue": "tree"},
-    ]
+    return _EXPECTED_MULTI_ACCOUNT_PARAMS_FORMAT
 
 
 @pytest.fixture
 def expected_batch_specific_params():
-    return [
-        ("BatchInputBucket", "inference"),
-        ("BatchInferenceData", os.environ["INFERENCEDATA"]),
-        ("BatchOutputLocation", os.environ["BATCHOUTPUT"]),
-    ]
+    return _EXPECTED_BATCH_SPECIFIC_PARAMS
 
 
 @pytest.fixture
 def expected_batch_params():
-    return [
-        ("AssetsBucket", "testassetsbucket"),
-        ("KmsKeyArn", ""),
-        ("BlueprintBucket", "testbucket"),
-        ("ModelName", "testmodel"),
-        ("ModelArtifactLocation", os.environ["MODELARTIFACTLOCATION"]),
-        ("InferenceInstance", os.environ["INSTANCETYPE"]),
-        ("CustomAlgorithmsECRRepoArn", "test-ecr-repo"),
-        ("ImageUri", "custom-image-uri"),
-        ("ModelPackageGroupName", ""),
-        ("ModelPackageName", os.environ["MODEL_PACKAGE_NAME"]),
-        ("BatchInputBucket", "inference"),
-        ("BatchInferenceData", os.environ["INFERENCEDATA"]),
-        ("BatchOutputLocation", os.environ["BATCHOUTPUT"]),
-    ]
+    return _EXPECTED_BATCH_PARAMS
+
+
+_REQUIRED_BYOM_BATCH_BUILTIN = frozenset(
+    (
+        "pipeline_type",
+        "model_name",
+        "model_artifact_location",
+        "inference_instance",
+        "batch_job_output_location",
+        "model_framework",
+        "model_framework_version",
+        "batch_inference_data",
+    )
+)
+
+
+_REQUIRED_BYOM_REALTIME_CUSTOM = frozenset(
+    (
+        "pipeline_type",
+        "model_name",
+        "model_artifact_location",
+        "inference_instance",
+        "data_capture_location",
+        "custom_image_uri",
+    )
+)
+
+
+_REQUIRED_BYOM_BATCH_CUSTOM = frozenset(
+    (
+        "pipeline_type",
+        "custom_image_uri",
+        "model_name",
+        "model_artifact_location",
+        "inference_instance",
+        "batch_inference_data",
+        "batch_job_output_location",
+    )
+)
+
+
+_REQUIRED_IMAGE_BUILDER = frozenset(
+    (
+        "pipeline_type",
+        "custom_algorithm_docker",
+        "ecr_repo_name",
+        "image_tag",
+    )
+)
 
 
 @pytest.fixture
@@ -337,51 +431,22 @@ def required_api_byom_realtime_builtin():
 
 @pytest.fixture
 def required_api_byom_batch_builtin():
-    return [
-        "pipeline_type",
-        "model_name",
-        "model_artifact_location",
-        "inference_instance",
-        "batch_job_output_location",
-        "model_framework",
-        "model_framework_version",
-        "batch_inference_data",
-    ]
+    return _REQUIRED_BYOM_BATCH_BUILTIN
 
 
 @pytest.fixture
 def required_api_byom_realtime_custom():
-    return [
-        "pipeline_type",
-        "model_name",
-        "model_artifact_location",
-        "inference_instance",
-        "data_capture_location",
-        "custom_image_uri",
-    ]
+    return _REQUIRED_BYOM_REALTIME_CUSTOM
 
 
 @pytest.fixture
 def required_api_byom_batch_custom():
-    return [
-        "pipeline_type",
-        "custom_image_uri",
-        "model_name",
-        "model_artifact_location",
-        "inference_instance",
-        "batch_inference_data",
-        "batch_job_output_location",
-    ]
+    return _REQUIRED_BYOM_BATCH_CUSTOM
 
 
 @pytest.fixture
 def required_api_image_builder():
-    return [
-        "pipeline_type",
-        "custom_algorithm_docker",
-        "ecr_repo_name",
-        "image_tag",
-    ]
+    return _REQUIRED_IMAGE_BUILDER
 
 
 @pytest.fixture
@@ -391,12 +456,12 @@ def api_model_monitor_event():
             "pipeline_type": "byom_model_monitor",
             "model_name": "mymodel2",
             "endpoint_name": "xgb-churn-prediction-endpoint",
-            "training_data": os.environ["TRAININGDATA"],
+            "training_data": _ENV["TRAININGDATA"],
             "baseline_job_output_location": "bucket/baseline_job_output",
-            "data_capture_location": os.environ["DATACAPTURE"],
+            "data_capture_location": _ENV["DATACAPTURE"],
             "monitoring_output_location": "bucket/monitoring_output",
-            "schedule_expression": os.environ["SCHEDULEEXP"],
-            "instance_type": os.environ["INSTANCETYPE"],
+            "schedule_expression": _ENV["SCHEDULEEXP"],
+            "instance_type": _ENV["INSTANCETYPE"],
             "instance_volume_size": "20",
         }
         if monitoring_type.lower() != "" and monitoring_type.lower() in [
@@ -452,51 +517,46 @@ def required_api_keys_model_monitor():
     return _required_api_keys_model_monitor
 
 
-@pytest.fixture
-def template_parameters_common():
-    def _template_parameters_common(event):
-        template_parameters = [
-            {
-                "ParameterKey": "NOTIFICATIONEMAIL",
-                "ParameterValue": os.environ["NOTIFICATION_EMAIL"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "BLUEPRINTBUCKET",
-                "ParameterValue": os.environ["BLUEPRINT_BUCKET"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "ASSETSBUCKET",
-                "ParameterValue": os.environ["ASSETS_BUCKET"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "MODELNAME",
-                "ParameterValue": event["model_name"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "MODELARTIFACTLOCATION",
-                "ParameterValue": event["model_artifact_location"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "INFERENCEINSTANCE",
-                "ParameterValue": event["inference_instance"],
-                "UsePreviousValue": True,
-            },
-        ]
-        return template_parameters
-
-    return _template_parameters_common
-
-
-@pytest.fixture
-def template_parameters_realtime_builtin(template_parameters_common):
-    def _template_parameters_realtime_builtin(event):
-        template_parameters = template_parameters_common(event)
-        template_parameters.extend(
+# event-independent template parameters, shared by every template_parameters_* builder
+_COMMON_STACK_PARAMETERS = [
+    {
+        "ParameterKey": "NOTIFICATIONEMAIL",
+        "ParameterValue": _ENV["NOTIFICATION_EMAIL"],
+        "UsePreviousValue": True,
+    },
+    {
+        "ParameterKey": "BLUEPRINTBUCKET",
+        "ParameterValue": _ENV["BLUEPRINT_BUCKET"],
+        "UsePreviousValue": True,
+    },
+    {
+        "ParameterKey": "ASSETSBUCKET",
+        "ParameterValue": _ENV["ASSETS_BUCKET"],
+        "UsePreviousValue": True,
+    },
+]
+
+
+def _build_template_parameters(event, *, kind):
+    # kind is one of "common", "realtime_builtin", "batch_builtin", "realtime_custom", "batch_custom"
+    return [
+        *_COMMON_STACK_PARAMETERS,
+        {
+            "ParameterKey": "MODELNAME",
+            "ParameterValue": event["model_name"],
+            "UsePreviousValue": True,
+        },
+        {
+            "ParameterKey": "MODELARTIFACTLOCATION",
+            "ParameterValue": event["model_artifact_location"],
+            "UsePreviousValue": True,
+        },
+        {
+            "ParameterKey": "INFERENCEINSTANCE",
+            "ParameterValue": event["inference_instance"],
+            "UsePreviousValue": True,
+        },
+        *(
             [
                 {
                     "ParameterKey": "MODELFRAMEWORK",
@@ -509,18 +569,21 @@ def template_parameters_realtime_builtin(template_parameters_common):
                     "UsePreviousValue": True,
                 },
             ]
-        )
-
-        return template_parameters
-
-    return _template_parameters_realtime_builtin
-
-
-@pytest.fixture
-def template_parameters_batch_builtin(template_parameters_realtime_builtin):
-    def _template_parameters_batch_builtin(event):
-        template_parameters = template_parameters_realtime_builtin(event)
-        template_parameters.extend(
+            if kind in ("realtime_builtin", "batch_builtin")
+            else []
+        ),
+        *(
+            [
+                {
+                    "ParameterKey": "CUSTOMCONTAINER",
+                    "ParameterValue": event["custom_model_container"],
+                    "UsePreviousValue": True,
+                },
+            ]
+            if kind in ("realtime_custom", "batch_custom")
+            else []
+        ),
+        *(
             [
                 {
                     "ParameterKey": "BATCHINFERENCEDATA",
@@ -528,58 +591,62 @@ def template_parameters_batch_builtin(template_parameters_realtime_builtin):
                     "UsePreviousValue": True,
                 },
             ]
-        )
+            if kind in ("batch_builtin", "batch_custom")
+            else []
+        ),
+    ]
 
-        return template_parameters
+
+@pytest.fixture
+def template_parameters_common():
+    def _template_parameters_common(event):
+        return _build_template_parameters(event, kind="common")
+
+    return _template_parameters_common
+
+
+@pytest.fixture
+def template_parameters_realtime_builtin():
+    def _template_parameters_realtime_builtin(event):
+        return _build_template_parameters(event, kind="realtime_builtin")
+
+    return _template_parameters_realtime_builtin
+
+
+@pytest.fixture
+def template_parameters_batch_builtin():
+    def _template_parameters_batch_builtin(event):
+        return _build_template_parameters(event, kind="batch_builtin")
 
     return _template_parameters_batch_builtin
 
 
 @pytest.fixture
-def template_parameters_realtime_custom(template_parameters_common):
+def template_parameters_realtime_custom():
     def _template_parameters_realtime_custom(event):
-        template_parameters = template_parameters_common(event)
-        template_parameters.extend(
-            [
-                {
-                    "ParameterKey": "CUSTOMCONTAINER",
-                    "ParameterValue": event["custom_model_container"],
-                    "UsePreviousValue": True,
-                },
-            ]
-        )
-
-        return template_parameters
+        return _build_template_parameters(event, kind="realtime_custom")
 
     return _template_parameters_realtime_custom
 
 
 @pytest.fixture
-def template_parameters_batch_custom(template_parameters_realtime_custom):
+def template_parameters_batch_custom():
     def _template_parameters_batch_custom(event):
-        template_parameters = template_parameters_realtime_custom(event)
-        template_parameters.extend(
-            [
-                {
-                    "ParameterKey": "BATCHINFERENCEDATA",
-                    "ParameterValue": event["batch_inference_data"],
-                    "UsePreviousValue": True,
-                },
-            ]
-        )
-
-        return template_parameters
+        return _build_template_parameters(event, kind="batch_custom")
 
     return _template_parameters_batch_custom
 
 
+# memoized so the same (endpoint_name, monitoring_type) pair always yields the same names
+@lru_cache(maxsize=None)
+def _generate_names(endpoint_name, monitoring_type):
+    baseline_job_name = f"{endpoint_name}-baseline-job-{uuid.uuid4().hex[:8]}"
+    monitoring_schedule_name = f"{endpoint_name}-monitoring-schedule-{monitoring_type}-{uuid.uuid4().hex[:8]}"
+    return (baseline_job_name, monitoring_schedule_name)
+
+
 @pytest.fixture
 def generate_names():
-    def _generate_names(endpoint_name, monitoring_type):
-        baseline_job_name = f"{endpoint_name}-baseline-job-{str(uuid.uuid4())[:8]}"
-        monitoring_schedule_name = f"{endpoint_name}-monitoring-schedule-{monitoring_type}-{str(uuid.uuid4())[:8]}"
-        return (baseline_job_name, monitoring_schedule_name)
-
     return _generate_names
 
 
@@ -588,21 +655,7 @@ def template_parameters_model_monitor(generate_names):
     def _template_parameters_model_monitor(event):
         baseline_job_name, monitoring_schedule_name = generate_names("test-endpoint", "dataquality")
         template_parameters = [
-            {
-                "ParameterKey": "NOTIFICATIONEMAIL",
-                "ParameterValue": os.environ["NOTIFICATION_EMAIL"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "BLUEPRINTBUCKET",
-                "ParameterValue": os.environ["BLUEPRINT_BUCKET"],
-                "UsePreviousValue": True,
-            },
-            {
-                "ParameterKey": "ASSETSBUCKET",
-                "ParameterValue": os.environ["ASSETS_BUCKET"],
-                "UsePreviousValue": True,
-            },
+            *_COMMON_STACK_PARAMETERS,
             {
                 "ParameterKey": "BASELINEJOBOUTPUTLOCATION",
                 "ParameterValue": event.get("baseline_job_output_location"),
@@ -665,11 +718,13 @@ def template_parameters_model_monitor(generate_names):
     return _template_parameters_model_monitor
 
 
+_GET_KEY = itemgetter("ParameterKey")
+
+
 @pytest.fixture
 def get_parameters_keys():
     def _get_parameters_keys(parameters):
-        keys = [param["ParameterKey"] for param in parameters]
-        return keys
+        return list(map(_GET_KEY, parameters))
 
     return _get_parameters_keys
 
@@ -12,48 +12,45 @@
 ######################################################################################################################
 
 import logging, uuid, requests
-from copy import copy
 from crhelper import CfnResource
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 helper = CfnResource(json_logging=True, log_level="INFO")
 
+# reuse the HTTPS connection to the metrics endpoint across warm invocations
+_SESSION = requests.Session()
+_METRICS_URL = "https://metrics.awssolutionsbuilder.com/generic"
+# seconds to wait for the metrics endpoint before giving up
+_TIMEOUT = 3
+
+
+# Define allowed keys. You need to update this list with new metrics
+_MAIN_KEYS = (
+    "bucketSelected",
+    "gitSelected",
+    "Region",
+    "IsMultiAccount",
+    "UseModelRegistry",
+    "Version",
+)
+_OPTIONAL_KEYS = ("IsDelegatedAccount",)
+_ALLOWED_KEYS = _MAIN_KEYS + _OPTIONAL_KEYS
+
 
 def _sanitize_data(resource_properties):
-    # Define allowed keys. You need to update this list with new metrics
-    main_keys = [
-        "bucketSelected",
-        "gitSelected",
-        "Region",
-        "IsMultiAccount",
-        "UseModelRegistry",
-        "Version",
-    ]
-    optional_keys = ["IsDelegatedAccount"]
-    allowed_keys = main_keys + optional_keys
-
-    # Remove ServiceToken (lambda arn) to avoid sending AccountId
-    resource_properties.pop("ServiceToken", None)
-    resource_properties.pop("Resource", None)
-
-    # Solution ID and unique ID are sent separately
-    resource_properties.pop("SolutionId", None)
-    resource_properties.pop("UUID", None)
-
-    # send only allowed metrics
-    sanitized_data = {key: resource_properties[key] for key in allowed_keys if key in resource_properties}
+    # send only allowed metrics. ServiceToken (lambda arn) is never sent to avoid sending AccountId,
+    # and Solution ID and unique ID are sent separately. The caller's dict is left untouched.
+    sanitized_data = {key: resource_properties[key] for key in _ALLOWED_KEYS if key in resource_properties}
 
     return sanitized_data
 
 
 def _send_anonymous_metrics(request_type, resource_properties):
     try:
-        metrics_data = _sanitize_data(copy(resource_properties))
+        metrics_data = _sanitize_data(resource_properties)
         metrics_data["RequestType"] = request_type
 
-        headers = {"Content-Type": "application/json"}
-
         # create the payload
         payload = {
             "Solution": resource_properties["SolutionId"],
@@ -62,10 +59,10 @@ def _send_anonymous_metrics(request_type, resource_properties):
             "Data": metrics_data,
         }
 
-        logger.info(f"Sending payload: {payload}")
-        response = requests.post("https://metrics.awssolutionsbuilder.com/generic", json=payload, headers=headers)
+        logger.info("Sending payload: %s", payload)
+        response = _SESSION.post(_METRICS_URL, json=payload, timeout=_TIMEOUT)
         # log the response
-        logger.info(f"Response from the metrics endpoint: {response.status_code} {response.reason}")
+        logger.info("Response from the metrics endpoint: %s %s", response.status_code, response.reason)
         # raise error if response is an 404, 503, 500, 403 etc.
         response.raise_for_status()
         return response
@@ -82,10 +79,14 @@ def custom_resource(event, _):
     resource_properties = event["ResourceProperties"]
     resource = resource_properties["Resource"]
 
-    if resource == "UUID" and (request_type == "Create" or request_type == "Update"):
-        random_id = str(uuid.uuid4())
-        helper.Data.update({"UUID": random_id})
-    elif resource == "AnonymousMetric":
+    if resource == "UUID":
+        if request_type == "Create" or request_type == "Update":
+            random_id = str(uuid.uuid4())
+            helper.Data.update({"UUID": random_id})
+        # nothing else to do for the UUID resource (e.g. on Delete)
+        return
+
+    if resource == "AnonymousMetric":
         # send Anonymous Metrics to AWS
         _send_anonymous_metrics(request_type, resource_properties)
 
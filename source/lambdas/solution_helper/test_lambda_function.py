@@ -42,7 +42,7 @@ class LambdaTest(unittest.TestCase):
         self.assertIsNotNone(lambda_function.helper.Data.get("UUID"))
 
         # test resource == "AnonymousMetric"
-        with mock.patch("requests.post", side_effect=mocked_requests_post) as mock_post:
+        with mock.patch("lambda_function._SESSION.post", side_effect=mocked_requests_post) as mock_post:
             event = {
                 "RequestType": "Create",
                 "ResourceProperties": {
@@ -68,7 +68,7 @@ class LambdaTest(unittest.TestCase):
                 },
             )
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
+    @mock.patch("lambda_function._SESSION.post", side_effect=mocked_requests_post)
     def test_send_anonymous_metrics_successful(self, mock_post):
         event = {
             "RequestType": "Create",
@@ -92,9 +92,9 @@ class LambdaTest(unittest.TestCase):
         actual_metrics_endpoint = mock_post.call_args.args[0]
         self.assertEqual(expected_metrics_endpoint, actual_metrics_endpoint)
 
-        expected_headers = {"Content-Type": "application/json"}
-        actual_headers = mock_post.call_args.kwargs["headers"]
-        self.assertEqual(expected_headers, actual_headers)
+        # json= encodes the payload and sets the Content-Type header, and the call is bounded by a timeout
+        self.assertEqual(set(mock_post.call_args.kwargs), {"json", "timeout"})
+        self.assertEqual(mock_post.call_args.kwargs["timeout"], 3)
 
         actual_payload = mock_post.call_args.kwargs["json"]
         self.assertIn("Solution", actual_payload)
@@ -117,7 +117,7 @@ class LambdaTest(unittest.TestCase):
             {"RequestType": "Create", "gitSelected": "True"},
         )
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post(404, "HTTPError"))
+    @mock.patch("lambda_function._SESSION.post", side_effect=mocked_requests_post(404, "HTTPError"))
     def test_send_anonymous_metrics_http_error(self, mock_post):
         event = {
             "RequestType": "Create",
@@ -134,7 +134,7 @@ class LambdaTest(unittest.TestCase):
         except AssertionError as e:
             self.fail(str(e))
 
-    @mock.patch("requests.post", side_effect=mocked_requests_post)
+    @mock.patch("lambda_function._SESSION.post", side_effect=mocked_requests_post)
     def test_send_anonymous_metrics_connection_error(self, mock_post):
         mock_post.side_effect = requests.exceptions.ConnectionError()
         event = {
@@ -152,7 +152,7 @@ class LambdaTest(unittest.TestCase):
         except AssertionError as e:
             self.fail(str(e))
 
-    @mock.patch("requests.post")
+    @mock.patch("lambda_function._SESSION.post")
     def test_send_anonymous_metrics_other_error(self, mock_post):
         try:
             invalid_event = {
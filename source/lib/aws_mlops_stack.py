@@ -125,7 +125,7 @@ class MLOpsStack(core.Stack):
         # Creating assets bucket so that users can upload ML Models to it.
         assets_bucket = s3.Bucket(
             self,
-            "pipeline-assets-" + str(uuid.uuid4()),
+            f"pipeline-assets-{uuid.uuid4()}",
             versioned=True,
             encryption=s3.BucketEncryption.S3_MANAGED,
             server_access_logs_bucket=access_logs_bucket,
@@ -166,7 +166,7 @@ class MLOpsStack(core.Stack):
             ecr_repo.repository_arn,
         ).to_string()
 
-        blueprints_bucket_name = "blueprint-repository-" + str(uuid.uuid4())
+        blueprints_bucket_name = f"blueprint-repository-{uuid.uuid4()}"
         blueprint_repository_bucket = s3.Bucket(
             self,
             blueprints_bucket_name,
@@ -319,10 +319,12 @@ class MLOpsStack(core.Stack):
                         "build": {
                             "commands": [
                                 "ls -a",
-                                "aws lambda invoke --function-name "
-                                + provisioner_apigw_lambda.lambda_function.function_name
-                                + " --payload fileb://mlops-config.json response.json"
-                                + " --invocation-type RequestResponse",
+                                (
+                                    "aws lambda invoke --function-name "
+                                    f"{provisioner_apigw_lambda.lambda_function.function_name} "
+                                    "--payload fileb://mlops-config.json response.json "
+                                    "--invocation-type RequestResponse"
+                                ),
                             ]
                         }
                     },
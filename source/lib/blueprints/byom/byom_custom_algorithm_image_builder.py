@@ -98,9 +98,9 @@ class BYOMCustomAlgorithmImageBuilderStack(core.Stack):
         )
 
         # add cfn nag suppressions
-        pipeline_child_nodes = image_builder_pipeline.node.find_all()
-        pipeline_child_nodes[1].node.default_child.cfn_options.metadata = suppress_pipeline_bucket()
-        pipeline_child_nodes[6].node.default_child.cfn_options.metadata = suppress_iam_complex()
+        image_builder_pipeline.artifact_bucket.node.default_child.cfn_options.metadata = suppress_pipeline_bucket()
+        pipeline_role_policy = image_builder_pipeline.role.node.find_child("DefaultPolicy")
+        pipeline_role_policy.node.default_child.cfn_options.metadata = suppress_iam_complex()
         # attaching iam permissions to the pipelines
         pipeline_permissions(image_builder_pipeline, assets_bucket)
 
@@ -11,30 +11,56 @@
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
 import os
-import json
-import boto3
-from shared.wrappers import api_exception_handler
+import logging
+import orjson
+from botocore.config import Config
+from shared.wrappers import BadRequest, api_exception_handler
 from shared.logger import get_logger
-from shared.helper import get_client
+from shared.helper import get_client, CLIENT_CONFIG
 
 logger = get_logger(__name__)
-sagemaker_client = get_client("sagemaker-runtime")
+# adaptive retries back off on the client side when the endpoint throttles during bursts
+sagemaker_client = get_client(
+    "sagemaker-runtime", config=CLIENT_CONFIG.merge(Config(retries={"max_attempts": 3, "mode": "adaptive"}))
+)
+# maximum number of records accepted in a single batched request
+MAX_BATCH_SIZE = 8
 
 
 @api_exception_handler
 def handler(event, context):
-    event_body = json.loads(event["body"])
+    event_body = orjson.loads(event["body"])
     endpoint_name = os.environ["SAGEMAKER_ENDPOINT_NAME"]
     return invoke(event_body, endpoint_name)
 
 
+def batch_payload(records):
+    """
+    Combine a list of records into one newline-delimited request body (e.g. text/csv or application/jsonlines),
+    so a batch of records is sent to the endpoint in a single invoke_endpoint call
+    :records: list of records, each either a string or a JSON-serializable object
+    :return: the newline-delimited request body
+    """
+    if not records:
+        raise BadRequest("Bad request. The payload has no records")
+    if len(records) > MAX_BATCH_SIZE:
+        raise BadRequest(f"Bad request. The payload has {len(records)} records, the maximum is {MAX_BATCH_SIZE}")
+    # serialize with orjson, the same library the request body is parsed with
+    return "\n".join(record if isinstance(record, str) else orjson.dumps(record).decode() for record in records)
+
+
 def invoke(event_body, endpoint_name, sm_client=sagemaker_client):
+    payload = event_body["payload"]
+    # a list payload is a batch of records, sent to the endpoint as one multi-record request
+    if isinstance(payload, list):
+        payload = batch_payload(payload)
     response = sm_client.invoke_endpoint(
-        EndpointName=endpoint_name, Body=event_body["payload"], ContentType=event_body["content_type"]
+        EndpointName=endpoint_name, Body=payload, ContentType=event_body["content_type"]
     )
-    logger.info(response)
+    # log the response metadata only; the predictions body can be large and is returned to the caller as is
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response metadata: %s", {key: value for key, value in response.items() if key != "Body"})
     predictions = response["Body"].read().decode()
-    logger.info(predictions)
     return {
         "statusCode": 200,
         "isBase64Encoded": False,
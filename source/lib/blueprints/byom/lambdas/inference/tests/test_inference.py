@@ -11,6 +11,7 @@
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
 import os
+import io
 import json
 from datetime import datetime
 import unittest
@@ -18,9 +19,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 import botocore.session
 from botocore.stub import Stubber, ANY
+from botocore.response import StreamingBody
 import boto3
 from shared.logger import get_logger
-from main import handler, invoke
+from shared.wrappers import BadRequest
+import main
+from main import handler, invoke, batch_payload
 
 mock_env_variables = {"ENDPOINT_URI": "test/test", "SAGEMAKER_ENDPOINT_NAME": "test-endpoint"}
 
@@ -47,6 +51,26 @@ def test_invoke(event):
         mock_client.invoke_endpoint.assert_called_with(EndpointName="test", Body="test", ContentType="text/csv")
 
 
+@patch.dict(os.environ, mock_env_variables)
+def test_invoke_batch():
+    with patch("boto3.client") as mock_client:
+        event_body = {"payload": ["1,2,3", "4,5,6"], "content_type": "text/csv"}
+        invoke(event_body, "test", sm_client=mock_client)
+        mock_client.invoke_endpoint.assert_called_once_with(
+            EndpointName="test", Body="1,2,3\n4,5,6", ContentType="text/csv"
+        )
+
+
+def test_batch_payload():
+    # non-string records are serialized as JSON lines
+    assert batch_payload([{"a": 1}, {"a": 2.5}]) == '{"a":1}\n{"a":2.5}'
+    # assert for exceptions
+    with pytest.raises(BadRequest):
+        batch_payload(["1"] * 9)
+    with pytest.raises(BadRequest):
+        batch_payload([])
+
+
 @patch("main.invoke")
 @patch("boto3.client")
 @patch.dict(os.environ, mock_env_variables)
@@ -54,3 +78,17 @@ def test_handler(mocked_client, mocked_invoke, event, expected_response):
     mocked_invoke.return_value = expected_response
     response = handler(event, {})
     assert response == expected_response
+
+
+@patch.dict(os.environ, mock_env_variables)
+def test_handler_endpoint_name(event):
+    sm_client = main.sagemaker_client
+    stubber = Stubber(sm_client)
+    expected_params = {"EndpointName": "test-endpoint", "Body": "test", "ContentType": "text/csv"}
+    stubber.add_response(
+        "invoke_endpoint", {"Body": StreamingBody(io.BytesIO(b"1"), 1), "ContentType": "text/csv"}, expected_params
+    )
+    with stubber:
+        response = handler(event, {})
+        stubber.assert_no_pending_responses()
+    assert response["body"] == "1"
@@ -102,6 +102,9 @@ def build_action(scope, ecr_repository_name, image_tag, source_output):
             },
             privileged=True,
         ),
+        # keep docker layers and the source between builds on the same host, so image rebuilds
+        # skip pulling the base image and rebuilding unchanged layers
+        cache=codebuild.Cache.local(codebuild.LocalCacheMode.DOCKER_LAYER, codebuild.LocalCacheMode.SOURCE),
         role=codebuild_role,
     )
     build_action_definition = codepipeline_actions.CodeBuildAction(
@@ -42,6 +42,15 @@ lambda_service = "lambda.amazonaws.com"
 lambda_handler = "main.handler"
 
 
+def suppress_default_policy(role):
+    """
+    suppress_default_policy adds the pipeline policy cfn_nag suppressions to a role's DefaultPolicy
+
+    :role: CDK role whose DefaultPolicy (created by add_to_policy) gets the suppressions
+    """
+    role.node.find_child("DefaultPolicy").node.default_child.cfn_options.metadata = suppress_pipeline_policy()
+
+
 def sagemaker_layer(scope, blueprint_bucket):
     """
     sagemaker_layer creates a Lambda layer with Sagemaker SDK installed in it to allow Lambda functions call
@@ -49,11 +58,18 @@ def sagemaker_layer(scope, blueprint_bucket):
 
     :blueprint_bucket: CDK object of the blueprint bucket that contains resources for BYOM pipeline
     :scope: CDK Construct scope that's needed to create CDK resources
-    :return: Lambda layer version in a form of a CDK object
+    :return: Lambda layer version in a form of a CDK object. The layer is created once per stack, and later
+    calls for the same stack return the existing layer
     """
+    # one layer per stack is shared by all of its lambda functions
+    stack = core.Stack.of(scope)
+    existing_layer = stack.node.try_find_child("sagemakerlayer")
+    if existing_layer:
+        return existing_layer
+
     # Lambda sagemaker layer for sagemaker sdk that is used in create sagemaker model step
     return lambda_.LayerVersion(
-        scope,
+        stack,
         "sagemakerlayer",
         code=lambda_.Code.from_bucket(blueprint_bucket, "blueprints/byom/lambdas/sagemaker_layer.zip"),
         compatible_runtimes=[lambda_.Runtime.PYTHON_3_8],
@@ -87,24 +103,23 @@ def batch_transform(
     a CDK CfnParameter object
     :batch_job_output_location: S3 bucket location where the result of the batch job will be stored
     :kms_key_arn: optional kmsKeyArn used to encrypt job's output and instance volume.
-    :sm_layer: sagemaker lambda layer
+    :sm_layer: sagemaker lambda layer (created by sagemaker_layer, shared with the stack's other lambdas)
     :return: Lambda function
     """
+    # a set is used since the same bucket can be used more than once, sorted to keep the synthesized order stable
     s3_read = s3_policy_read(
-        list(
-            set(
-                [
-                    f"arn:aws:s3:::{assets_bucket.bucket_name}",
-                    f"arn:aws:s3:::{assets_bucket.bucket_name}/*",
-                    f"arn:aws:s3:::{batch_input_bucket}",
-                    f"arn:aws:s3:::{batch_inference_data}",
-                ]
-            )
+        sorted(
+            {
+                assets_bucket.bucket_arn,
+                assets_bucket.arn_for_objects("*"),
+                f"arn:{core.Aws.PARTITION}:s3:::{batch_input_bucket}",
+                f"arn:{core.Aws.PARTITION}:s3:::{batch_inference_data}",
+            }
         )
     )
     s3_write = s3_policy_write(
         [
-            f"arn:aws:s3:::{batch_job_output_location}/*",
+            f"arn:{core.Aws.PARTITION}:s3:::{batch_job_output_location}/*",
         ]
     )
 
@@ -123,7 +138,7 @@ def batch_transform(
     lambda_role.add_to_policy(batch_transform_permissions)
     lambda_role.add_to_policy(s3_read)
     lambda_role.add_to_policy(s3_write)
-    add_logs_policy(lambda_role)
+    logs_policy = add_logs_policy(lambda_role)
 
     batch_transform_lambda = lambda_.Function(
         scope,
@@ -133,6 +148,8 @@ def batch_transform(
         layers=[sm_layer],
         role=lambda_role,
         code=lambda_.Code.from_bucket(blueprint_bucket, "blueprints/byom/lambdas/batch_transform.zip"),
+        # importing the sagemaker sdk from the layer is CPU bound, and Lambda allocates CPU in proportion to memory
+        memory_size=512,
         environment={
             "model_name": model_name,
             "inference_instance": inference_instance,
@@ -145,6 +162,8 @@ def batch_transform(
     )
 
     batch_transform_lambda.node.default_child.cfn_options.metadata = suppress_lambda_policies()
+    # the logs policy is shared by the stack's lambda roles, so make sure it is attached before the function runs
+    batch_transform_lambda.node.add_dependency(logs_policy)
 
     return batch_transform_lambda
 
@@ -187,7 +206,7 @@ def create_baseline_job_lambda(
     :max_runtime_seconds: max time the job is allowed to run
     :kms_key_arn: kms key arn to encrypt the baseline job's output
     :stack_name: model monitor stack name
-    :sm_layer: sagemaker lambda layer
+    :sm_layer: sagemaker lambda layer (created by sagemaker_layer, shared with the stack's other lambdas)
     :problem_type: used with ModelQuality baseline. Type of Machine Learning problem. Valid values are
             ['Regression'|'BinaryClassification'|'MulticlassClassification'] (default: None)
     :ground_truth_attribute: index or JSONpath to locate actual label(s) (used with ModelQuality baseline).
@@ -204,13 +223,13 @@ def create_baseline_job_lambda(
     """
     s3_read = s3_policy_read(
         [
-            f"arn:aws:s3:::{assets_bucket.bucket_name}",
-            f"arn:aws:s3:::{assets_bucket.bucket_name}/{baseline_data_location}",
+            assets_bucket.bucket_arn,
+            assets_bucket.arn_for_objects(baseline_data_location),
         ]
     )
     s3_write = s3_policy_write(
         [
-            f"arn:aws:s3:::{baseline_job_output_location}/*",
+            f"arn:{core.Aws.PARTITION}:s3:::{baseline_job_output_location}/*",
         ]
     )
 
@@ -246,15 +265,26 @@ def create_baseline_job_lambda(
     sagemaker_role.add_to_policy(create_baseline_job_policy)
     sagemaker_role.add_to_policy(s3_read)
     sagemaker_role.add_to_policy(s3_write)
-    sagemaker_role_nodes = sagemaker_role.node.find_all()
-    sagemaker_role_nodes[2].node.default_child.cfn_options.metadata = suppress_pipeline_policy()
+    suppress_default_policy(sagemaker_role)
     lambda_role.add_to_policy(iam.PolicyStatement(actions=["iam:PassRole"], resources=[sagemaker_role.role_arn]))
     lambda_role.add_to_policy(create_baseline_job_policy)
     lambda_role.add_to_policy(s3_write)
     lambda_role.add_to_policy(s3_read)
-    add_logs_policy(lambda_role)
+    logs_policy = add_logs_policy(lambda_role)
 
     # defining the lambda function that gets invoked in this stage
+    # ModelQuality related variables (they will be passed by the Model Monitor stack)
+    model_quality_environment_variables = (
+        {
+            "PROBLEM_TYPE": problem_type,
+            "GROUND_TRUTH_ATTRIBUTE": ground_truth_attribute,
+            "INFERENCE_ATTRIBUTE": inference_attribute,
+            "PROBABILITY_ATTRIBUTE": probability_attribute,
+            "PROBABILITY_THRESHOLD_ATTRIBUTE": probability_threshold_attribute,
+        }
+        if monitoring_type == "ModelQuality"
+        else {}
+    )
     # create environment variabes
     lambda_environment_variables = {
         "MONITORING_TYPE": monitoring_type,
@@ -270,19 +300,8 @@ def create_baseline_job_lambda(
         "KMS_KEY_ARN": kms_key_arn,
         "STACK_NAME": stack_name,
         "LOG_LEVEL": "INFO",
+        **model_quality_environment_variables,
     }
-
-    # add ModelQuality related variables (they will be passed by the Model Monitor stack)
-    if monitoring_type == "ModelQuality":
-        lambda_environment_variables.update(
-            {
-                "PROBLEM_TYPE": problem_type,
-                "GROUND_TRUTH_ATTRIBUTE": ground_truth_attribute,
-                "INFERENCE_ATTRIBUTE": inference_attribute,
-                "PROBABILITY_ATTRIBUTE": probability_attribute,
-                "PROBABILITY_THRESHOLD_ATTRIBUTE": probability_threshold_attribute,
-            }
-        )
     create_baseline_job_lambda = lambda_.Function(
         scope,
         "create_data_baseline_job",
@@ -291,13 +310,14 @@ def create_baseline_job_lambda(
         role=lambda_role,
         code=lambda_.Code.from_bucket(blueprint_bucket, "blueprints/byom/lambdas/create_baseline_job.zip"),
         layers=[sm_layer],
+        memory_size=512,
         environment=lambda_environment_variables,
         timeout=core.Duration.minutes(10),
     )
 
     create_baseline_job_lambda.node.default_child.cfn_options.metadata = suppress_lambda_policies()
-    role_child_nodes = create_baseline_job_lambda.role.node.find_all()
-    role_child_nodes[2].node.default_child.cfn_options.metadata = suppress_pipeline_policy()
+    create_baseline_job_lambda.node.add_dependency(logs_policy)
+    suppress_default_policy(create_baseline_job_lambda.role)
 
     return create_baseline_job_lambda
 
@@ -355,7 +375,7 @@ def create_stackset_action(
 
     lambda_role.add_to_policy(cloudformation_stackset_permissions)
     lambda_role.add_to_policy(cloudformation_stackset_instances_permissions)
-    add_logs_policy(lambda_role)
+    logs_policy = add_logs_policy(lambda_role)
 
     # add delegated admin account policy
     delegated_admin_policy = delegated_admin_policy_document(scope, f"{action_name}DelegatedAdminPolicy")
@@ -380,8 +400,8 @@ def create_stackset_action(
     )
 
     create_update_cf_stackset_lambda.node.default_child.cfn_options.metadata = suppress_lambda_policies()
-    role_child_nodes = create_update_cf_stackset_lambda.role.node.find_all()
-    role_child_nodes[2].node.default_child.cfn_options.metadata = suppress_pipeline_policy()
+    create_update_cf_stackset_lambda.node.add_dependency(logs_policy)
+    suppress_default_policy(create_update_cf_stackset_lambda.role)
 
     # Create codepipeline action
     create_stackset_action = codepipeline_actions.LambdaInvokeAction(
@@ -525,9 +545,8 @@ def create_copy_assets_lambda(scope, blueprint_repository_bucket_name):
 
     custom_resource_lambda_fn.node.default_child.cfn_options.metadata = suppress_lambda_policies()
     # grant permission to download the file from the source bucket
-    custom_resource_lambda_fn.add_to_role_policy(
-        s3_policy_read([f"arn:aws:s3:::{source_bucket}", f"arn:aws:s3:::{source_bucket}/*"])
-    )
+    source_bucket_arn = f"arn:{core.Aws.PARTITION}:s3:::{source_bucket}"
+    custom_resource_lambda_fn.add_to_role_policy(s3_policy_read([source_bucket_arn, f"{source_bucket_arn}/*"]))
 
     return custom_resource_lambda_fn
 
@@ -562,10 +581,16 @@ def create_uuid_custom_resource(scope, create_model_registry, helper_function_ar
     :create_model_registry: whether or not the solution will create a SageMaker Model registry (Yes/No)
     :helper_function_arn: solution helper lambda function arn
 
-    :return: CDK Custom Resource
+    :return: CDK Custom Resource. The resource is created once per stack, and later calls for the same stack
+    return the existing one, so the helper function is invoked once per stack operation
     """
+    stack = core.Stack.of(scope)
+    existing_resource = stack.node.try_find_child("CreateUniqueID")
+    if existing_resource:
+        return existing_resource
+
     return core.CustomResource(
-        scope,
+        stack,
         "CreateUniqueID",
         service_token=helper_function_arn,
         # add the template's paramater "create_model_registry" to the custom resource properties
@@ -12,7 +12,8 @@
 # #####################################################################################################################
 from aws_cdk import aws_iam as iam, core
 
-logs_str = ":logs:"
+logs_arn_prefix = f"arn:{core.Aws.PARTITION}:logs:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}"
+lambda_arn_prefix = f"arn:{core.Aws.PARTITION}:lambda:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}"
 
 
 def pipeline_permissions(pipeline, assets_bucket):
@@ -33,8 +34,8 @@ def pipeline_permissions(pipeline, assets_bucket):
             ],
             resources=[
                 assets_bucket.arn_for_objects("*"),
-                "arn:" + core.Aws.PARTITION + ":lambda:" + core.Aws.REGION + ":" + core.Aws.ACCOUNT_ID + ":function:*",
-                "arn:" + core.Aws.PARTITION + logs_str + core.Aws.REGION + ":" + core.Aws.ACCOUNT_ID + ":log-group:*",
+                f"{lambda_arn_prefix}:function:*",
+                f"{logs_arn_prefix}:log-group:*",
             ],
         )
     )
@@ -58,40 +59,73 @@ def codepipeline_policy():
 
 
 def add_logs_policy(function_role):
-    function_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=[
-                "logs:CreateLogStream",
-                "logs:PutLogEvents",
-            ],
-            resources=[
-                "arn:"
-                + core.Aws.PARTITION
-                + logs_str
-                + core.Aws.REGION
-                + ":"
-                + core.Aws.ACCOUNT_ID
-                + ":log-group:/aws/lambda/*",
-                "arn:"
-                + core.Aws.PARTITION
-                + logs_str
-                + core.Aws.REGION
-                + ":"
-                + core.Aws.ACCOUNT_ID
-                + ":log-group:*:log-stream:*",
+    """
+    add_logs_policy attaches the Lambda logs policy to a function's role. The policy is created once per stack
+    and attached to every Lambda role in it, so its statements are rendered once in the template
+
+    :function_role: the role assumed by the Lambda function
+    :return: the shared logs policy, so the function can depend on it being attached
+    """
+    stack = core.Stack.of(function_role)
+    logs_policy = stack.node.try_find_child("LambdaLogsPolicy")
+    if not logs_policy:
+        logs_policy = iam.Policy(
+            stack,
+            "LambdaLogsPolicy",
+            statements=[
+                iam.PolicyStatement(
+                    actions=[
+                        "logs:CreateLogStream",
+                        "logs:PutLogEvents",
+                    ],
+                    resources=[
+                        f"{logs_arn_prefix}:log-group:/aws/lambda/*",
+                        f"{logs_arn_prefix}:log-group:*:log-stream:*",
+                    ],
+                ),
+                iam.PolicyStatement(
+                    actions=["logs:CreateLogGroup"],
+                    resources=[f"{logs_arn_prefix}:*"],
+                ),
             ],
         )
-    )
-    function_role.add_to_policy(
-        iam.PolicyStatement(
-            actions=["logs:CreateLogGroup"],
-            resources=["arn:" + core.Aws.PARTITION + logs_str + core.Aws.REGION + ":" + core.Aws.ACCOUNT_ID + ":*"],
-        )
-    )
+    logs_policy.attach_to_role(function_role)
 
+    return logs_policy
 
-def suppress_pipeline_policy():
-    return {
+
+class ReadOnlyDict(dict):
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("the suppression metadata is shared between resources and can not be modified")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+class ReadOnlyList(list):
+    _read_only = ReadOnlyDict._read_only
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+
+def freeze_metadata(metadata):
+    """
+    freeze_metadata makes a metadata literal read-only, so the shared suppression metadata can't be changed
+    by one resource and leak into the others. jsii only serializes dict and list (sub)classes, which rules out
+    types.MappingProxyType and tuples
+
+    :metadata: the metadata literal (dicts, lists and scalars)
+    :return: a read-only copy of the metadata
+    """
+    if isinstance(metadata, dict):
+        return ReadOnlyDict((key, freeze_metadata(value)) for key, value in metadata.items())
+    if isinstance(metadata, list):
+        return ReadOnlyList(freeze_metadata(value) for value in metadata)
+    return metadata
+
+
+pipeline_policy_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -104,10 +138,15 @@ def suppress_pipeline_policy():
             ]
         }
     }
+)
 
 
-def suppress_list_function_policy():
-    return {
+def suppress_pipeline_policy():
+    return pipeline_policy_metadata
+
+
+list_function_policy_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -117,20 +156,30 @@ def suppress_list_function_policy():
             ]
         }
     }
+)
 
 
-def suppress_s3_access_policy():
-    return {
+def suppress_list_function_policy():
+    return list_function_policy_metadata
+
+
+s3_access_policy_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {"id": "W35", "reason": "This is the access bucket"},
             ]
         }
     }
+)
 
 
-def suppress_assets_bucket():
-    return {
+def suppress_s3_access_policy():
+    return s3_access_policy_metadata
+
+
+assets_bucket_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -142,10 +191,15 @@ def suppress_assets_bucket():
             ]
         }
     }
+)
 
 
-def suppress_pipeline_bucket():
-    return {
+def suppress_assets_bucket():
+    return assets_bucket_metadata
+
+
+pipeline_bucket_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -164,10 +218,15 @@ def suppress_pipeline_bucket():
             ]
         }
     }
+)
 
 
-def suppress_iam_complex():
-    return {
+def suppress_pipeline_bucket():
+    return pipeline_bucket_metadata
+
+
+iam_complex_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -177,10 +236,15 @@ def suppress_iam_complex():
             ]
         }
     }
+)
 
 
-def suppress_sns():
-    return {
+def suppress_iam_complex():
+    return iam_complex_metadata
+
+
+sns_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -190,10 +254,15 @@ def suppress_sns():
             ]
         }
     }
+)
 
 
-def suppress_ecr_policy():
-    return {
+def suppress_sns():
+    return sns_metadata
+
+
+ecr_policy_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -203,10 +272,15 @@ def suppress_ecr_policy():
             ]
         }
     }
+)
 
 
-def suppress_cloudwatch_policy():
-    return {
+def suppress_ecr_policy():
+    return ecr_policy_metadata
+
+
+cloudwatch_policy_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -216,10 +290,15 @@ def suppress_cloudwatch_policy():
             ]
         }
     }
+)
 
 
-def suppress_cloudformation_action():
-    return {
+def suppress_cloudwatch_policy():
+    return cloudwatch_policy_metadata
+
+
+cloudformation_action_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -246,6 +325,11 @@ def suppress_cloudformation_action():
             ]
         }
     }
+)
+
+
+def suppress_cloudformation_action():
+    return cloudformation_action_metadata
 
 
 def apply_secure_bucket_policy(bucket):
@@ -261,8 +345,8 @@ def apply_secure_bucket_policy(bucket):
     )
 
 
-def suppress_lambda_policies():
-    return {
+lambda_policies_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -280,10 +364,15 @@ def suppress_lambda_policies():
             ]
         }
     }
+)
 
 
-def suppress_lambda_event_mapping():
-    return {
+def suppress_lambda_policies():
+    return lambda_policies_metadata
+
+
+lambda_event_mapping_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -293,10 +382,15 @@ def suppress_lambda_event_mapping():
             ]
         }
     }
+)
 
 
-def suppress_delegated_admin_policy():
-    return {
+def suppress_lambda_event_mapping():
+    return lambda_event_mapping_metadata
+
+
+delegated_admin_policy_metadata = freeze_metadata(
+    {
         "cfn_nag": {
             "rules_to_suppress": [
                 {
@@ -305,4 +399,9 @@ def suppress_delegated_admin_policy():
                 }
             ]
         }
-    }
\ No newline at end of file
+    }
+)
+
+
+def suppress_delegated_admin_policy():
+    return delegated_admin_policy_metadata
@@ -10,32 +10,67 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
 #  and limitations under the License.                                                                                 #
 # #####################################################################################################################
+from typing import List, NamedTuple
 from aws_cdk import aws_iam as iam, core
 from lib.blueprints.byom.pipeline_definitions.helpers import (
     suppress_ecr_policy,
     suppress_cloudwatch_policy,
     suppress_delegated_admin_policy,
+    logs_arn_prefix,
+    lambda_arn_prefix,
 )
 
 sagemaker_arn_prefix = f"arn:{core.Aws.PARTITION}:sagemaker:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}"
+iam_arn_prefix = f"arn:{core.Aws.PARTITION}:iam:"
+
+sagemaker_model_actions = ("sagemaker:CreateModel", "sagemaker:DescribeModel", "sagemaker:DeleteModel")
+sagemaker_endpoint_actions = (
+    "sagemaker:CreateEndpointConfig",
+    "sagemaker:DescribeEndpointConfig",
+    "sagemaker:DeleteEndpointConfig",
+    "sagemaker:CreateEndpoint",
+    "sagemaker:DescribeEndpoint",
+    "sagemaker:DeleteEndpoint",
+)
+sagemaker_monitor_actions = (
+    "sagemaker:DescribeEndpointConfig",
+    "sagemaker:DescribeEndpoint",
+    "sagemaker:CreateMonitoringSchedule",
+    "sagemaker:DescribeMonitoringSchedule",
+    "sagemaker:StopMonitoringSchedule",
+    "sagemaker:DeleteMonitoringSchedule",
+    "sagemaker:DescribeProcessingJob",
+    "sagemaker:CreateDataQualityJobDefinition",
+    "sagemaker:DescribeDataQualityJobDefinition",
+    "sagemaker:DeleteDataQualityJobDefinition",
+    "sagemaker:CreateModelQualityJobDefinition",
+    "sagemaker:DescribeModelQualityJobDefinition",
+    "sagemaker:DeleteModelQualityJobDefinition",
+)
+model_registry_actions = (
+    "sagemaker:DescribeModelPackageGroup",
+    "sagemaker:DescribeModelPackage",
+    "sagemaker:ListModelPackages",
+    "sagemaker:UpdateModelPackage",
+    "sagemaker:CreateModel",  # NOSONAR: permission needs to be repeated for clarity
+)
+s3_read_actions = ("s3:GetObject", "s3:ListBucket")
+ecr_read_actions = (
+    "ecr:BatchCheckLayerAvailability",
+    "ecr:GetDownloadUrlForLayer",
+    "ecr:DescribeRepositories",  # NOSONAR: permission needs to be repeated for clarity
+    "ecr:DescribeImages",
+    "ecr:BatchGetImage",
+)
 
 
 def sagemaker_policy_statement(is_realtime_pipeline, endpoint_name, endpoint_name_provided):
-    actions = ["sagemaker:CreateModel", "sagemaker:DescribeModel", "sagemaker:DeleteModel"]
+    actions = list(sagemaker_model_actions)
     resources = [f"{sagemaker_arn_prefix}:model/mlopssagemakermodel*"]
 
     if is_realtime_pipeline:
         # extend actions
-        actions.extend(
-            [
-                "sagemaker:CreateEndpointConfig",
-                "sagemaker:DescribeEndpointConfig",
-                "sagemaker:DeleteEndpointConfig",
-                "sagemaker:CreateEndpoint",
-                "sagemaker:DescribeEndpoint",
-                "sagemaker:DeleteEndpoint",
-            ]
-        )
+        actions.extend(sagemaker_endpoint_actions)
 
         # if a custom endpoint_name is provided, use it. Otherwise, use the generated name
         endpoint = core.Fn.condition_if(
@@ -87,21 +122,7 @@ def create_service_role(scope, id, service, description):
 
 def sagemaker_monitor_policy_statement(baseline_job_name, monitoring_schedule_name, endpoint_name):
     return iam.PolicyStatement(
-        actions=[
-            "sagemaker:DescribeEndpointConfig",
-            "sagemaker:DescribeEndpoint",
-            "sagemaker:CreateMonitoringSchedule",
-            "sagemaker:DescribeMonitoringSchedule",
-            "sagemaker:StopMonitoringSchedule",
-            "sagemaker:DeleteMonitoringSchedule",
-            "sagemaker:DescribeProcessingJob",
-            "sagemaker:CreateDataQualityJobDefinition",
-            "sagemaker:DescribeDataQualityJobDefinition",
-            "sagemaker:DeleteDataQualityJobDefinition",
-            "sagemaker:CreateModelQualityJobDefinition",
-            "sagemaker:DescribeModelQualityJobDefinition",
-            "sagemaker:DeleteModelQualityJobDefinition",
-        ],
+        actions=list(sagemaker_monitor_actions),
         resources=[
             f"{sagemaker_arn_prefix}:endpoint-config/mlopssagemakerendpointconfig*",
             f"{sagemaker_arn_prefix}:endpoint/{endpoint_name}",
@@ -136,9 +157,7 @@ def sagemaker_logs_metrics_policy_document(scope, id):
                     "logs:GetLogEvents",
                     "logs:PutLogEvents",
                 ],
-                resources=[
-                    f"arn:{core.Aws.PARTITION}:logs:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}:log-group:/aws/sagemaker/*"
-                ],
+                resources=[f"{logs_arn_prefix}:log-group:/aws/sagemaker/*"],
             ),
             iam.PolicyStatement(
                 actions=[
@@ -167,7 +186,7 @@ def s3_policy_read_write(resources_list):
 def s3_policy_read(resources_list, principals=None):
     return iam.PolicyStatement(
         principals=principals,
-        actions=["s3:GetObject", "s3:ListBucket"],
+        actions=list(s3_read_actions),
         resources=resources_list,
     )
 
@@ -175,13 +194,7 @@ def s3_policy_read(resources_list, principals=None):
 def create_ecr_repo_policy(principals):
     return iam.PolicyStatement(
         effect=iam.Effect.ALLOW,
-        actions=[
-            "ecr:DescribeImages",
-            "ecr:DescribeRepositories",  # NOSONAR: permission needs to be repeated for clarity
-            "ecr:GetDownloadUrlForLayer",
-            "ecr:BatchGetImage",
-            "ecr:BatchCheckLayerAvailability",
-        ],
+        actions=list(ecr_read_actions),
         principals=principals,
     )
 
@@ -222,13 +235,7 @@ def ecr_policy_document(scope, id, repo_arn):
         id,
         statements=[
             iam.PolicyStatement(
-                actions=[
-                    "ecr:BatchCheckLayerAvailability",
-                    "ecr:GetDownloadUrlForLayer",
-                    "ecr:DescribeRepositories",  # NOSONAR: permission needs to be repeated for clarity
-                    "ecr:DescribeImages",
-                    "ecr:BatchGetImage",
-                ],
+                actions=list(ecr_read_actions),
                 resources=[repo_arn],
             ),
             iam.PolicyStatement(
@@ -266,28 +273,26 @@ def kms_policy_document(scope, id, kms_key_arn):
     )
 
 
-def get_model_registry_actions_resources(model_package_group_name):
-    actions = [
-        "sagemaker:DescribeModelPackageGroup",
-        "sagemaker:DescribeModelPackage",
-        "sagemaker:ListModelPackages",
-        "sagemaker:UpdateModelPackage",
-        "sagemaker:CreateModel",  # NOSONAR: permission needs to be repeated for clarity
-    ]
+class ActionsResources(NamedTuple):
+    actions: List[str]
+    resources: List[str]
 
-    resources = [
-        f"{sagemaker_arn_prefix}:model-package-group/{model_package_group_name}",
-        f"{sagemaker_arn_prefix}:model-package/{model_package_group_name}/*",
-    ]
 
-    return (actions, resources)
+def get_model_registry_actions_resources(model_package_group_name):
+    return ActionsResources(
+        actions=list(model_registry_actions),
+        resources=[
+            f"{sagemaker_arn_prefix}:model-package-group/{model_package_group_name}",
+            f"{sagemaker_arn_prefix}:model-package/{model_package_group_name}/*",
+        ],
+    )
 
 
 def model_registry_policy_statement(model_package_group_name):
-    actions, resources = get_model_registry_actions_resources(model_package_group_name)
+    model_registry_permissions = get_model_registry_actions_resources(model_package_group_name)
     return iam.PolicyStatement(
-        actions=actions,
-        resources=resources,
+        actions=model_registry_permissions.actions,
+        resources=model_registry_permissions.resources,
     )
 
 
@@ -300,18 +305,16 @@ def model_registry_policy_document(scope, id, model_package_group_name):
 
 
 def model_package_group_policy(model_package_group_name, accounts_list):
-    actions, resources = get_model_registry_actions_resources(model_package_group_name)
+    model_registry_permissions = get_model_registry_actions_resources(model_package_group_name)
     return {
         "Version": "2012-10-17",
         "Statement": [
             {
                 "Sid": "AddPermModelPackageGroup",
                 "Effect": "Allow",
-                "Principal": {
-                    "AWS": [f"arn:{core.Aws.PARTITION}:iam::{account_id}:root" for account_id in accounts_list]
-                },
-                "Action": actions,
-                "Resource": resources,
+                "Principal": {"AWS": [f"{iam_arn_prefix}:{account_id}:root" for account_id in accounts_list]},
+                "Action": model_registry_permissions.actions,
+                "Resource": model_registry_permissions.resources,
             }
         ],
     }
@@ -376,6 +379,7 @@ def create_orchestrator_policy(
     blueprint_repository_bucket,
     assets_s3_bucket_name,
 ):
+    assets_bucket_arn = f"arn:{core.Aws.PARTITION}:s3:::{assets_s3_bucket_name}"
     return iam.Policy(
         scope,
         "lambdaOrchestratorPolicy",
@@ -453,16 +457,16 @@ def create_orchestrator_policy(
                     "lambda:UpdateFunctionConfiguration",
                 ],
                 resources=[
-                    f"arn:{core.Aws.PARTITION}:lambda:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}:layer:*",
-                    f"arn:{core.Aws.PARTITION}:lambda:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}:function:*",
+                    f"{lambda_arn_prefix}:layer:*",
+                    f"{lambda_arn_prefix}:function:*",
                 ],
             ),
             s3_policy_read(
                 [
                     blueprint_repository_bucket.bucket_arn,
-                    f"arn:{core.Aws.PARTITION}:s3:::{assets_s3_bucket_name}",
+                    assets_bucket_arn,
                     blueprint_repository_bucket.arn_for_objects("*"),
-                    f"arn:{core.Aws.PARTITION}:s3:::{assets_s3_bucket_name}/*",
+                    f"{assets_bucket_arn}/*",
                 ]
             ),
             iam.PolicyStatement(
@@ -502,7 +506,7 @@ def create_orchestrator_policy(
                     "logs:DescribeLogGroups",
                 ],
                 resources=[
-                    f"arn:{core.Aws.PARTITION}:logs:{core.Aws.REGION}:{core.Aws.ACCOUNT_ID}:log-group:*",
+                    f"{logs_arn_prefix}:log-group:*",
                 ],
             ),
             iam.PolicyStatement(
@@ -519,7 +523,7 @@ def create_orchestrator_policy(
                 actions=[
                     "s3:PutObject",  # NOSONAR: permission needs to be repeated for clarity
                 ],
-                resources=[f"arn:{core.Aws.PARTITION}:s3:::{assets_s3_bucket_name}/*"],
+                resources=[f"{assets_bucket_arn}/*"],
             ),
             iam.PolicyStatement(
                 actions=[
@@ -61,28 +61,29 @@ def create_sagemaker_monitor_role(
     # logs/metrics permissions
     logs_metrics_policy = sagemaker_logs_metrics_policy_document(scope, "SagemakerLogsMetricsPolicy")
     # S3 permissions
-    s3_read_resources = list(
-        set(  # set is used since a same bucket can be used more than once
-            [
-                f"arn:aws:s3:::{assets_bucket_name}",
-                f"arn:aws:s3:::{assets_bucket_name}/*",
-                f"arn:aws:s3:::{data_capture_bucket}",
-                f"arn:aws:s3:::{data_capture_s3_location}/*",
-                f"arn:aws:s3:::{baseline_output_bucket}",
-                f"arn:aws:s3:::{baseline_job_output_location}/*",
-            ]
-        )
+    s3_read_resources = sorted(
+        {  # set is used since a same bucket can be used more than once, sorted to keep the synthesized order stable
+            f"arn:{core.Aws.PARTITION}:s3:::{assets_bucket_name}",
+            f"arn:{core.Aws.PARTITION}:s3:::{assets_bucket_name}/*",
+            f"arn:{core.Aws.PARTITION}:s3:::{data_capture_bucket}",
+            f"arn:{core.Aws.PARTITION}:s3:::{data_capture_s3_location}/*",
+            f"arn:{core.Aws.PARTITION}:s3:::{baseline_output_bucket}",
+            f"arn:{core.Aws.PARTITION}:s3:::{baseline_job_output_location}/*",
+        }
     )
 
     # add permissions to read ground truth data (only for ModelQuality monitor)
     if model_monitor_ground_truth_input:
         s3_read_resources.extend(
-            [f"arn:aws:s3:::{model_monitor_ground_truth_input}", f"arn:aws:s3:::{model_monitor_ground_truth_input}/*"]
+            [
+                f"arn:{core.Aws.PARTITION}:s3:::{model_monitor_ground_truth_input}",
+                f"arn:{core.Aws.PARTITION}:s3:::{model_monitor_ground_truth_input}/*",
+            ]
         )
     s3_read = s3_policy_read(s3_read_resources)
     s3_write = s3_policy_write(
         [
-            f"arn:aws:s3:::{output_s3_location}/*",
+            f"arn:{core.Aws.PARTITION}:s3:::{output_s3_location}/*",
         ]
     )
     # IAM PassRole permission
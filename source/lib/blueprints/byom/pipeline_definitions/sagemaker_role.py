@@ -69,21 +69,20 @@ def create_sagemaker_role(
     # logs permissions
     logs_policy = sagemaker_logs_metrics_policy_document(scope, "LogsMetricsPolicy")
     # S3 permissions
+    # a set is used since the same bucket can be used more than once, sorted to keep the synthesized order stable
     s3_read = s3_policy_read(
-        list(
-            set(
-                [
-                    f"arn:aws:s3:::{assets_bucket_name}",
-                    f"arn:aws:s3:::{assets_bucket_name}/*",
-                    f"arn:aws:s3:::{input_bucket_name}",
-                    f"arn:aws:s3:::{input_s3_location}",
-                ]
-            )
+        sorted(
+            {
+                f"arn:{core.Aws.PARTITION}:s3:::{assets_bucket_name}",
+                f"arn:{core.Aws.PARTITION}:s3:::{assets_bucket_name}/*",
+                f"arn:{core.Aws.PARTITION}:s3:::{input_bucket_name}",
+                f"arn:{core.Aws.PARTITION}:s3:::{input_s3_location}",
+            }
         )
     )
     s3_write = s3_policy_write(
         [
-            f"arn:aws:s3:::{output_s3_location}/*",
+            f"arn:{core.Aws.PARTITION}:s3:::{output_s3_location}/*",
         ]
     )
     # IAM PassRole permission
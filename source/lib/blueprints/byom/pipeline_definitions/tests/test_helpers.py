@@ -0,0 +1,73 @@
+##################################################################################################################
+#  Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                            #
+#                                                                                                                     #
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance     #
+#  with the License. A copy of the License is located at                                                              #
+#                                                                                                                     #
+#  http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                     #
+#  or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES  #
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions     #
+#  and limitations under the License.                                                                                 #
+# #####################################################################################################################
+import pytest
+from lib.blueprints.byom.pipeline_definitions import helpers
+from lib.blueprints.byom.pipeline_definitions.helpers import (
+    suppress_lambda_policies,
+    suppress_sns,
+)
+
+expected_lambda_policies_metadata = {
+    "cfn_nag": {
+        "rules_to_suppress": [
+            {
+                "id": "W89",
+                "reason": "The lambda function does not need to be attached to a vpc.",
+            },
+            {
+                "id": "W58",
+                "reason": "The lambda functions role already has permissions to write cloudwatch logs",
+            },
+            {
+                "id": "W92",
+                "reason": "The lambda function does need to define ReservedConcurrentExecutions",
+            },
+        ]
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda metadata: metadata.update({"cfn_nag": {}}),
+        lambda metadata: metadata.__setitem__("cfn_nag", {}),
+        lambda metadata: metadata.__ior__({"cfn_nag": {}}),
+        lambda metadata: metadata.pop("cfn_nag"),
+        lambda metadata: metadata.clear(),
+        lambda metadata: metadata["cfn_nag"]["rules_to_suppress"].append({"id": "W1"}),
+        lambda metadata: metadata["cfn_nag"]["rules_to_suppress"].__iadd__([{"id": "W1"}]),
+        lambda metadata: metadata["cfn_nag"]["rules_to_suppress"][0].update({"id": "W1"}),
+    ],
+)
+def test_suppression_metadata_is_read_only(mutate):
+    metadata = suppress_lambda_policies()
+    with pytest.raises(TypeError):
+        mutate(metadata)
+    # the shared metadata is unchanged
+    assert metadata == expected_lambda_policies_metadata
+
+
+@pytest.mark.parametrize("suppress", [getattr(helpers, name) for name in dir(helpers) if name.startswith("suppress_")])
+def test_suppression_metadata_is_shared(suppress):
+    metadata = suppress()
+    assert metadata is suppress()
+    assert isinstance(metadata, helpers.ReadOnlyDict)
+    assert metadata["cfn_nag"]["rules_to_suppress"]
+
+
+def test_suppression_metadata_copies_are_mutable():
+    # copies are plain dicts that can be changed without touching the shared metadata
+    metadata = {**suppress_sns(), "extra": {}}
+    metadata.update({"more": {}})
+    assert "extra" not in suppress_sns() and "more" not in suppress_sns()
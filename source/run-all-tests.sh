@@ -145,6 +145,19 @@ run_blueprint_lambda_test() {
 	done
 }
 
+run_cdk_python_test() {
+	echo "------------------------------------------------------------------------------"
+	echo "[Test] Run CDK pipeline definitions unit tests"
+	echo "------------------------------------------------------------------------------"
+
+	# The pipeline definitions import aws-cdk, which is installed from the CDK app requirements
+	cd $source_dir
+	pip install -r requirements.txt
+	cd $source_dir/lib/blueprints/byom/pipeline_definitions
+	run_python_test pipeline_definitions
+	cd $source_dir
+}
+
 # Save the current working directory and set source directory
 source_dir=$PWD
 cd $source_dir
@@ -162,6 +175,7 @@ setup_and_activate_python_env $source_dir
 python --version
 run_framework_lambda_test
 run_blueprint_lambda_test
+run_cdk_python_test
 
 # Return to the source/ level where we started
 cd $source_dir
\ No newline at end of file